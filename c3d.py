@@ -2,17 +2,108 @@
 
 from __future__ import unicode_literals
 
-import array
-import io
 import numpy as np
+import io
+import os
+import stat
 import struct
 import warnings
 import codecs
+import bisect
+import functools
+import itertools
+import types
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 PROCESSOR_INTEL = 84
 PROCESSOR_DEC = 85
 PROCESSOR_MIPS = 86
 
+# Precompiled formats for the parameter section
+_NAME_HEADER = struct.Struct('bb')
+_INT16_LE = struct.Struct('<h')
+_INT16_BE = struct.Struct('>h')
+_UINT16_LE = struct.Struct('<H')
+_UINT32_LE = struct.Struct('<I')
+_FLOAT32_LE = struct.Struct('<f')
+_SECTION_HEADER = struct.Struct('BBBB')
+
+# A block of zero bytes, used for padding to the 512 byte block boundaries
+_ZERO_BLOCK = b'\x00' * 512
+
+# Number of frames the Reader decodes in a single pass
+_READ_BATCH_FRAMES = 1024
+
+# Number of frames the Writer encodes in a single pass
+_WRITE_BATCH_FRAMES = 1024
+
+# Maximum number of buffers passed to a single os.writev call
+_IOV_MAX = 512
+
+# Number of cameras flagged in each camera byte, only the lower 7 bits are camera flags
+_CAM_POPCOUNT = np.array([bin(i & 0x7f).count('1') for i in range(256)], dtype=np.uint8)
+
+# Cache of precompiled struct.Struct objects, indexed by format string
+_STRUCTS = {}
+
+# struct format characters for numpy (kind, itemsize) pairs
+_STRUCT_CHARS = {
+    ('i', 1): 'b', ('u', 1): 'B',
+    ('i', 2): 'h', ('u', 2): 'H',
+    ('i', 4): 'i', ('u', 4): 'I',
+    ('i', 8): 'q', ('u', 8): 'Q',
+    ('f', 4): 'f', ('f', 8): 'd',
+}
+
+# Cache of precompiled struct.Struct objects, indexed by numpy data type
+_SCALAR_STRUCTS = {}
+
+
+def _encode(value):
+    '''Encode a name or description to UTF-8 bytes (None encodes as empty bytes).'''
+    if value is None:
+        return b''
+    if isinstance(value, bytes):
+        return value
+    return value.encode('utf-8')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_key(key):
+    '''Split a 'GROUP:PARAM' or 'GROUP.PARAM' key into upper-case (group, param) names.
+
+    The parameter name is None if the key only names a group.
+    '''
+    group = key.upper()
+    param = None
+    if '.' in group:
+        group, param = group.split('.', 1)
+    if ':' in group:
+        group, param = group.split(':', 1)
+    return group, param
+
+
+def _get_struct(fmt):
+    '''Get a precompiled struct.Struct for the given format string.'''
+    s = _STRUCTS.get(fmt)
+    if s is None:
+        s = _STRUCTS[fmt] = struct.Struct(fmt)
+    return s
+
+
+def _get_scalar_struct(dtype):
+    '''Get a precompiled struct.Struct unpacking a single value of a numpy data type.'''
+    s = _SCALAR_STRUCTS.get(dtype)
+    if s is None:
+        dt = np.dtype(dtype)
+        order = dt.byteorder if dt.byteorder in '<>' else '='
+        s = _SCALAR_STRUCTS[dtype] = _get_struct(order + _STRUCT_CHARS[dt.kind, dt.itemsize])
+    return s
+
 
 class DataTypes(object):
     ''' Container defining different data types used for reading file data.
@@ -160,9 +251,110 @@ def DEC_to_IEEE_BYTES(bytes):
     # 2) Exponent == 0, DEC numbers are then 0 or undefined while IEEE is not. NaN are produced when exponent == 255.
     # Here method 1) is used, which mean that only small numbers will be represented incorrectly.
 
-    return np.frombuffer(reshuffled.tobytes(),
-                         dtype=np.float32,
-                         count=int(len(bytes) / 4))
+    return reshuffled[:len(bytes) // 4 * 4].view(np.float32)
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _decode_point_frame(raw, scale, is_float, out):
+        '''Decode the raw point words of a frame, shape (points, 4), into out (points, 5).'''
+        for j in range(raw.shape[0]):
+            if is_float:
+                out[j, 0] = raw[j, 0]
+                out[j, 1] = raw[j, 1]
+                out[j, 2] = raw[j, 2]
+                word = np.int64(np.int32(raw[j, 3]))
+                valid = (word & 0x80008000) == 0
+            else:
+                out[j, 0] = raw[j, 0] * scale
+                out[j, 1] = raw[j, 1] * scale
+                out[j, 2] = raw[j, 2] * scale
+                word = np.int64(raw[j, 3])
+                valid = word > -1
+            if valid:
+                out[j, 3] = (word & 0xff) * scale
+                # Branchless (SWAR) popcount of the camera bits 8 to 14
+                c = (word >> 8) & 0x7f
+                c = c - ((c >> 1) & 0x55)
+                c = (c & 0x33) + ((c >> 2) & 0x33)
+                out[j, 4] = (c + (c >> 4)) & 0x0f
+            else:
+                out[j, 3] = -1.0
+                out[j, 4] = -1.0
+
+    @numba.njit(cache=True, fastmath=True)
+    def _decode_analog_frame(raw, gain, bias, out):
+        '''Decode the raw analog words of a frame, shape (samples, channels), into out (channels, samples).'''
+        for j in range(raw.shape[0]):
+            for k in range(raw.shape[1]):
+                out[k, j] = raw[j, k] * gain[k] - bias[k]
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _decode_points_jit(raw, scale, is_float, out):
+        '''Decode raw point words of shape (frames, points, 4) into out (frames, points, 5).
+
+        Compiled decoder of :func:`Reader.read_frames` for files without analog
+        data, the raw words must be in native byte order.
+        '''
+        for i in numba.prange(raw.shape[0]):
+            _decode_point_frame(raw[i], scale, is_float, out[i])
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _decode_frames_jit(raw_points, raw_analog, scale, is_float, gain, bias, points, analog):
+        '''Decode the raw point and analog words of all frames in a single pass.
+
+        Compiled decoder of :func:`Reader.read_frames` for files with analog
+        data, each analog channel is converted with a single multiply-add. The
+        raw words must be in native byte order.
+        '''
+        for i in numba.prange(raw_points.shape[0]):
+            _decode_point_frame(raw_points[i], scale, is_float, points[i])
+            _decode_analog_frame(raw_analog[i], gain, bias, analog[i])
+else:
+    _decode_points_jit = None
+    _decode_frames_jit = None
+
+
+def _native(arr):
+    '''View or convert an array in native byte order.'''
+    return arr.astype(arr.dtype.newbyteorder('='), copy=False)
+
+
+def _write_buffers(handle, buffers):
+    '''Write a sequence of buffers (bytes or contiguous arrays) to a file handle.
+
+    If the handle is a plain file object, the buffers are written to its file
+    descriptor with scatter-gather ``os.writev`` calls, otherwise they are
+    written one by one.
+    '''
+    writev = getattr(os, 'writev', None)
+    fd = None
+    # Compressed file objects (gzip, bz2, lzma) also report the descriptor of the file
+    if isinstance(handle, (io.FileIO, io.BufferedWriter, io.BufferedRandom)):
+        try:
+            fd = handle.fileno()
+        except (OSError, ValueError):
+            pass
+    if writev is None or fd is None:
+        for buffer in buffers:
+            handle.write(buffer)
+        return
+
+    # Bypass the buffer of the handle, continuing at its current position
+    handle.flush()
+    pos = handle.tell()
+    views = [memoryview(buffer).cast('B') for buffer in buffers]
+    first = 0
+    while first < len(views):
+        written = writev(fd, views[first:first + _IOV_MAX])
+        pos += written
+        # Skip the written buffers, the last one may be written partially
+        while first < len(views) and written >= len(views[first]):
+            written -= len(views[first])
+            first += 1
+        if written:
+            views[first] = views[first][written:]
+    handle.seek(pos)
 
 
 class Header(object):
@@ -206,10 +398,30 @@ class Header(object):
         POINTS:ACTUAL_END_FIELD parameters.
     '''
 
-    # Read/Write header formats, read values as unsigned ints rather then floats.
-    BINARY_FORMAT_WRITE = '<BBHHHHHfHHf274sHHH164s44s'
-    BINARY_FORMAT_READ = '<BBHHHHHIHHI274sHHH164s44s'
-    BINARY_FORMAT_READ_BIG_ENDIAN = '>BBHHHHHIHHI274sHHH164s44s'
+    # Read/Write header layouts, read values as unsigned ints rather then floats.
+    BINARY_DTYPE_READ = np.dtype([
+        ('parameter_block', 'u1'),
+        ('magic', 'u1'),
+        ('point_count', '<u2'),
+        ('analog_count', '<u2'),
+        ('first_frame', '<u2'),
+        ('last_frame', '<u2'),
+        ('max_gap', '<u2'),
+        ('scale_factor', '<u4'),
+        ('data_block', '<u2'),
+        ('analog_per_frame', '<u2'),
+        ('frame_rate', '<u4'),
+        ('pad1', 'V274'),
+        ('long_event_labels', '<u2'),
+        ('event_count', '<u2'),
+        ('reserved', '<u2'),
+        ('event_block', 'V164'),
+        ('pad2', 'V44'),
+    ])
+    BINARY_DTYPE_READ_BIG_ENDIAN = BINARY_DTYPE_READ.newbyteorder('>')
+    BINARY_DTYPE_WRITE = np.dtype([
+        (name, '<f4' if name in ('scale_factor', 'frame_rate') else fmt)
+        for name, (fmt, _) in BINARY_DTYPE_READ.fields.items()])
 
     def __init__(self, handle=None):
         '''Create a new Header object.
@@ -258,26 +470,24 @@ class Header(object):
             will be written to describe the parameters in this Header. The
             handle must be writeable.
         '''
+        header = np.zeros((), self.BINARY_DTYPE_WRITE)
+        header['parameter_block'] = self.parameter_block
+        header['magic'] = 0x50
+        header['point_count'] = self.point_count
+        header['analog_count'] = self.analog_count
+        header['first_frame'] = self.first_frame
+        header['last_frame'] = self.last_frame
+        header['max_gap'] = self.max_gap
+        header['scale_factor'] = self.scale_factor
+        header['data_block'] = self.data_block
+        header['analog_per_frame'] = self.analog_per_frame
+        header['frame_rate'] = self.frame_rate
+        # If True write long_event_key else 0
+        header['long_event_labels'] = self.long_event_labels and 0x3039 or 0x0
+        header['event_count'] = self.event_count
+        header['event_block'] = bytes(self.event_block[:164]).ljust(164, b'\x00')
         handle.seek(0)
-        handle.write(struct.pack(self.BINARY_FORMAT_WRITE,
-                                 # Pack vars:
-                                 self.parameter_block,
-                                 0x50,
-                                 self.point_count,
-                                 self.analog_count,
-                                 self.first_frame,
-                                 self.last_frame,
-                                 self.max_gap,
-                                 self.scale_factor,
-                                 self.data_block,
-                                 self.analog_per_frame,
-                                 self.frame_rate,
-                                 b'',
-                                 self.long_event_labels and 0x3039 or 0x0,  # If True write long_event_key else 0
-                                 self.event_count,
-                                 0x0,
-                                 self.event_block,
-                                 b''))
+        handle.write(header.tobytes())
 
     def __str__(self):
         '''Return a string representation of this Header's attributes.'''
@@ -295,7 +505,7 @@ class Header(object):
 long_event_labels: {0.long_event_labels}
       event_block: {0.event_block}'''.format(self)
 
-    def read(self, handle, fmt=BINARY_FORMAT_READ):
+    def read(self, handle, dtype=BINARY_DTYPE_READ):
         '''Read and parse binary header data from a file handle.
 
         This method reads exactly 512 bytes from the beginning of the given file
@@ -308,7 +518,7 @@ long_event_labels: {0.long_event_labels}
             will be read to initialize the attributes in this Header. The handle
             must be readable.
 
-        fmt : Formating string used to read the header.
+        dtype : Structured dtype describing the header layout.
 
         Raises
         ------
@@ -316,31 +526,27 @@ long_event_labels: {0.long_event_labels}
             If the magic byte from the header is not 80 (the C3D magic value).
         '''
         handle.seek(0)
-        raw = handle.read(512)
-
-        (self.parameter_block,
-         magic,
-         self.point_count,
-         self.analog_count,
-         self.first_frame,
-         self.last_frame,
-         self.max_gap,
-         self.scale_factor,
-         self.data_block,
-         self.analog_per_frame,
-         self.frame_rate,
-         _,
-         self.long_event_labels,
-         self.event_count,
-         __,
-         self.event_block,
-         _) = struct.unpack(fmt, raw)
+        header = np.frombuffer(handle.read(512), dtype, count=1)[0]
+
+        self.parameter_block = int(header['parameter_block'])
+        magic = int(header['magic'])
+        self.point_count = int(header['point_count'])
+        self.analog_count = int(header['analog_count'])
+        self.first_frame = int(header['first_frame'])
+        self.last_frame = int(header['last_frame'])
+        self.max_gap = int(header['max_gap'])
+        self.scale_factor = int(header['scale_factor'])
+        self.data_block = int(header['data_block'])
+        self.analog_per_frame = int(header['analog_per_frame'])
+        self.frame_rate = int(header['frame_rate'])
+        self.event_count = int(header['event_count'])
+        self.event_block = header['event_block'].tobytes()
 
         # Check magic number if reading in little endian
         assert magic == 80, 'C3D magic {} != 80 !'.format(magic)
 
         # Check long event key
-        self.long_event_labels = self.long_event_labels == 0x3039
+        self.long_event_labels = int(header['long_event_labels']) == 0x3039
 
     def processor_convert(self, dtypes, handle):
         ''' Function interpreting the header once processor type has been determined.
@@ -356,7 +562,7 @@ long_event_labels: {0.long_event_labels}
             float_unpack = UNPACK_FLOAT_IEEE
         elif dtypes.is_mips:
             # Re-read header in big-endian
-            self.read(handle, Header.BINARY_FORMAT_READ_BIG_ENDIAN)
+            self.read(handle, Header.BINARY_DTYPE_READ_BIG_ENDIAN)
             # Then unpack
             self.scale_factor = UNPACK_FLOAT_IEEE(self.scale_factor)
             self.frame_rate = UNPACK_FLOAT_IEEE(self.frame_rate)
@@ -419,10 +625,13 @@ class Param(object):
         column-major order. For arrays of strings, the dimensions here will be
         the number of columns (length of each string) followed by the number of
         rows (number of strings).
-    bytes : str
-        Raw data for this parameter.
-    handle :
-        File handle positioned at the first byte of a .c3d parameter description.
+    bytes : bytes-like
+        Raw data for this parameter. Parameters read from a file hold a
+        memoryview into the parameter section of the file.
+    buffer : bytes-like, optional
+        Buffer holding a .c3d parameter description.
+    offset : int, optional
+        Offset of the first byte of the parameter description in `buffer`.
     '''
 
     def __init__(self,
@@ -432,7 +641,8 @@ class Param(object):
                  bytes_per_element=1,
                  dimensions=None,
                  bytes=b'',
-                 handle=None):
+                 buffer=None,
+                 offset=0):
         '''Set up a new parameter, only the name is required.'''
         self.name = name
         self.dtype = dtype
@@ -440,12 +650,72 @@ class Param(object):
         self.bytes_per_element = bytes_per_element
         self.dimensions = dimensions or []
         self.bytes = bytes
-        if handle:
-            self.read(handle)
+        if buffer is not None:
+            self.read(buffer, offset)
 
     def __repr__(self):
         return '<Param: {}>'.format(self.desc)
 
+    def __getstate__(self):
+        '''Copy the data out of the parameter section, memoryviews can't be pickled.'''
+        state = self.__dict__.copy()
+        state['_bytes'] = bytes(self._bytes)
+        state['_bytes_array'] = state['_string_array'] = None
+        return state
+
+    @property
+    def name(self):
+        '''Name of this parameter.'''
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._name_bytes = value.encode('utf-8')
+        self._binary_size = None
+
+    @property
+    def desc(self):
+        '''Brief description of this parameter.'''
+        return self._desc
+
+    @desc.setter
+    def desc(self, value):
+        self._desc = value
+        self._desc_bytes = value.encode('utf-8')
+        self._binary_size = None
+
+    @property
+    def bytes_per_element(self):
+        '''Size of each element of data, -1 for string data.'''
+        return self._bytes_per_element
+
+    @bytes_per_element.setter
+    def bytes_per_element(self, value):
+        self._bytes_per_element = value
+        self._binary_size = None
+
+    @property
+    def dimensions(self):
+        '''Dimensions of the array data, stored in column-major order.'''
+        return self._dimensions
+
+    @dimensions.setter
+    def dimensions(self, value):
+        self._dimensions = value
+        self._binary_size = None
+        self._bytes_array = self._string_array = None
+
+    @property
+    def bytes(self):
+        '''Raw data for this parameter.'''
+        return self._bytes
+
+    @bytes.setter
+    def bytes(self, value):
+        self._bytes = value
+        self._bytes_array = self._string_array = None
+
     @property
     def num_elements(self):
         '''Return the number of elements in this parameter's array value.'''
@@ -461,16 +731,18 @@ class Param(object):
 
     def binary_size(self):
         '''Return the number of bytes needed to store this parameter.'''
-        return (
-            1 +  # group_id
-            2 +  # next offset marker
-            1 + len(self.name.encode('utf-8')) +  # size of name and name bytes
-            1 +  # data size
-            # size of dimensions and dimension bytes
-            1 + len(self.dimensions) +
-            self.total_bytes +  # data
-            1 + len(self.desc.encode('utf-8'))  # size of desc and desc bytes
-        )
+        if self._binary_size is None:
+            self._binary_size = (
+                1 +  # group_id
+                2 +  # next offset marker
+                1 + len(self._name_bytes) +  # size of name and name bytes
+                1 +  # data size
+                # size of dimensions and dimension bytes
+                1 + len(self.dimensions) +
+                self.total_bytes +  # data
+                1 + len(self._desc_bytes)  # size of desc and desc bytes
+            )
+        return self._binary_size
 
     def write(self, group_id, handle):
         '''Write binary data for this parameter to a file handle.
@@ -482,44 +754,65 @@ class Param(object):
         handle : file handle
             An open, writable, binary file handle.
         '''
-        name = self.name.encode('utf-8')
-        handle.write(struct.pack('bb', len(name), group_id))
-        handle.write(name)
-        handle.write(struct.pack('<h', self.binary_size() - 2 - len(name)))
-        handle.write(struct.pack('b', self.bytes_per_element))
-        handle.write(struct.pack('B', len(self.dimensions)))
-        handle.write(struct.pack('B' * len(self.dimensions), *self.dimensions))
-        if self.bytes:
-            handle.write(self.bytes)
-        desc = self.desc.encode('utf-8')
-        handle.write(struct.pack('B', len(desc)))
-        handle.write(desc)
-
-    def read(self, handle):
-        '''Read binary data for this parameter from a file handle.
-
-        This reads exactly enough data from the current position in the file to
-        initialize the parameter.
+        name = self._name_bytes
+        desc = self._desc_bytes
+        dims = self.dimensions
+        # Pack the full record at once, parameters of the same shape share a format
+        fmt = '<bb{}shbB{}B{}sB{}s'.format(len(name), len(dims), self.total_bytes, len(desc))
+        handle.write(_get_struct(fmt).pack(
+            len(name), group_id, name,
+            self.binary_size() - 2 - len(name),
+            self.bytes_per_element,
+            len(dims), *dims,
+            bytes(self.bytes),
+            len(desc), desc))
+
+    def read(self, buffer, pos=0):
+        '''Read binary data for this parameter from a buffer.
+
+        This parses exactly enough data from the given position in the buffer
+        to initialize the parameter.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Buffer holding the binary parameter description.
+        pos : int, optional
+            Offset of the first byte of the parameter description.
+
+        Returns
+        -------
+        pos : int
+            Offset of the first byte after the parameter description.
         '''
-        self.bytes_per_element, = struct.unpack('b', handle.read(1))
-        dims, = struct.unpack('B', handle.read(1))
-        self.dimensions = [struct.unpack('B', handle.read(1))[
-            0] for _ in range(dims)]
+        mv = memoryview(buffer)
+        # Indexing a memoryview yields unsigned bytes, the element size is signed
+        bpe = mv[pos]
+        self.bytes_per_element = bpe - 256 if bpe > 127 else bpe
+        dims = mv[pos + 1]
+        pos += 2
+        self.dimensions = list(mv[pos:pos + dims])
+        pos += dims
         self.bytes = b''
         if self.total_bytes:
-            self.bytes = handle.read(self.total_bytes)
-        desc_size, = struct.unpack('B', handle.read(1))
-        self.desc = desc_size and self.dtype.decode_string(handle.read(desc_size)) or ''
+            # Zero-copy view into the buffer holding the parameter section
+            self.bytes = mv[pos:pos + self.total_bytes]
+            pos += self.total_bytes
+        desc_size = mv[pos]
+        pos += 1
+        self.desc = desc_size and self.dtype.decode_string(mv[pos:pos + desc_size]) or ''
+        return pos + desc_size
 
     def _as(self, dtype):
-        '''Unpack the raw bytes of this param using the given struct format.'''
-        return np.frombuffer(self.bytes, count=1, dtype=dtype)[0]
+        '''Unpack the raw bytes of this param as a single value of the given data type.'''
+        return _get_scalar_struct(dtype).unpack_from(self.bytes)[0]
 
     def _as_array(self, dtype):
         '''Unpack the raw bytes of this param using the given data format.'''
         assert self.dimensions, \
             '{}: cannot get value as {} array!'.format(self.name, dtype)
-        elems = np.frombuffer(self.bytes, dtype=dtype)
+        # Map the raw bytes directly, without an intermediate copy
+        elems = np.frombuffer(self.bytes, dtype=dtype, count=self.num_elements)
         # Reverse shape as the shape is defined in fortran format
         return elems.reshape(self.dimensions[::-1])
 
@@ -538,7 +831,7 @@ class Param(object):
             else:
                 data = self._as_array(dtype)
             if len(self.dimensions) < 2:    # Check if data is contained in a single dimension
-                return data.flatten()
+                return data.ravel()
             return data
 
     @property
@@ -600,7 +893,7 @@ class Param(object):
     @property
     def bytes_value(self):
         '''Get the param as a raw byte string.'''
-        return self.bytes
+        return bytes(self.bytes)
 
     @property
     def string_value(self):
@@ -649,42 +942,53 @@ class Param(object):
         else:  # is_ieee or is_mips
             return self._as_array(self.dtype.float32)
 
+    def _words(self):
+        '''Get the fixed-width words of a multi-dimensional string param as a flat list of byte strings.'''
+        word_len = self.dimensions[0]
+        count = int(np.prod(self.dimensions[1:]))
+        if word_len == 0:
+            return [b''] * count
+        # View the data as fixed-width words, the void type preserves trailing null bytes
+        words = np.frombuffer(self.bytes, dtype=np.dtype((np.void, word_len)), count=count)
+        return words.tolist()
+
+    def _word_array(self, words):
+        '''Arrange a flat list of words in the (transposed) shape of the param.'''
+        # Convert Fortran shape (data in memory is identical, shape is transposed)
+        dims = self.dimensions[1:][::-1]  # Identical to: [:0:-1]
+        arr = np.empty(len(words), dtype=object)
+        arr[:] = words
+        return arr.reshape(dims)
+
     @property
     def bytes_array(self):
         '''Get the param as an array of raw byte strings.'''
-        # Decode different dimensions
-        if len(self.dimensions) == 0:
-            return np.array([])
-        elif len(self.dimensions) == 1:
-            return np.array(self.bytes)
-        else:
-            # Convert Fortran shape (data in memory is identical, shape is transposed)
-            word_len = self.dimensions[0]
-            dims = self.dimensions[1:][::-1]  # Identical to: [:0:-1]
-            byte_steps = np.cumprod(self.dimensions[:-1])[::-1]
-            # Generate mult-dimensional array and parse byte words
-            byte_arr = np.empty(dims, dtype=object)
-            for i in np.ndindex(*dims):
-                # Calculate byte offset as sum of each array index times the byte step of each dimension.
-                off = np.sum(np.multiply(i, byte_steps))
-                byte_arr[i] = self.bytes[off:off+word_len]
-            return byte_arr
+        # Decoded once, the cache is reset when the bytes or dimensions change
+        if self._bytes_array is None:
+            # Decode different dimensions
+            if len(self.dimensions) == 0:
+                self._bytes_array = np.array([])
+            elif len(self.dimensions) == 1:
+                self._bytes_array = np.array(self.bytes_value)
+            else:
+                self._bytes_array = self._word_array(self._words())
+        return self._bytes_array
 
     @property
     def string_array(self):
         '''Get the param as a python array of unicode strings.'''
-        # Decode different dimensions
-        if len(self.dimensions) == 0:
-            return np.array([])
-        elif len(self.dimensions) == 1:
-            return np.array([self.string_value])
-        else:
-            # Parse byte sequences
-            byte_arr = self.bytes_array
-            # Decode sequences
-            for i in np.ndindex(byte_arr.shape):
-                byte_arr[i] = self.dtype.decode_string(byte_arr[i])
-            return byte_arr
+        # Decoded once, the cache is reset when the bytes or dimensions change
+        if self._string_array is None:
+            # Decode different dimensions
+            if len(self.dimensions) == 0:
+                self._string_array = np.array([])
+            elif len(self.dimensions) == 1:
+                self._string_array = np.array([self.string_value])
+            else:
+                # Decode sequences
+                decode = self.dtype.decode_string
+                self._string_array = self._word_array([decode(word) for word in self._words()])
+        return self._string_array
 
 
 class Group(object):
@@ -709,6 +1013,26 @@ class Group(object):
     def __repr__(self):
         return '<Group: {}>'.format(self.desc)
 
+    @property
+    def name(self):
+        '''Name of this parameter group.'''
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._name_bytes = _encode(value)
+
+    @property
+    def desc(self):
+        '''Description for this parameter group.'''
+        return self._desc
+
+    @desc.setter
+    def desc(self, value):
+        self._desc = value
+        self._desc_bytes = _encode(value)
+
     def get(self, key, default=None):
         '''Get a parameter by key.
 
@@ -745,9 +1069,9 @@ class Group(object):
         '''Return the number of bytes to store this group and its parameters.'''
         return (
             1 +  # group_id
-            1 + len(self.name.encode('utf-8')) +  # size of name and name bytes
+            1 + len(self._name_bytes) +  # size of name and name bytes
             2 +  # next offset marker
-            1 + len(self.desc.encode('utf-8')) +  # size of desc and desc bytes
+            1 + len(self._desc_bytes) +  # size of desc and desc bytes
             sum(p.binary_size() for p in self.params.values()))
 
     def write(self, group_id, handle):
@@ -760,13 +1084,11 @@ class Group(object):
         handle : file handle
             An open, writable, binary file handle.
         '''
-        name = self.name.encode('utf-8')
-        desc = self.desc.encode('utf-8')
-        handle.write(struct.pack('bb', len(name), -group_id))
-        handle.write(name)
-        handle.write(struct.pack('<h', 3 + len(desc)))
-        handle.write(struct.pack('B', len(desc)))
-        handle.write(desc)
+        name = self._name_bytes
+        desc = self._desc_bytes
+        fmt = '<bb{}shB{}s'.format(len(name), len(desc))
+        handle.write(_get_struct(fmt).pack(
+            len(name), -group_id, name, 3 + len(desc), len(desc), desc))
         for param in self.params.values():
             param.write(group_id, handle)
 
@@ -823,70 +1145,97 @@ class Manager(object):
     def __init__(self, header=None):
         '''Set up a new Manager with a Header.'''
         self.header = header or Header()
-        self.groups = {}
+        self._groups_by_name = {}
+        self._groups_by_id = {}
+        self._groups = types.MappingProxyType({})
+        # Group IDs in ascending order, the order groups are written in
+        self._group_ids = []
+
+    @property
+    def groups(self):
+        '''Read-only mapping of the parameter groups, indexed by both name and numeric ID.
+
+        Use :func:`add_group` to add groups.
+        '''
+        return self._groups
+
+    def _update_groups(self):
+        '''Rebuild the mapping returned by :attr:`groups` after groups were added or renamed.'''
+        groups = dict(self._groups_by_id)
+        groups.update(self._groups_by_name)
+        self._groups = types.MappingProxyType(groups)
 
     def check_metadata(self):
         '''Ensure that the metadata in our file is self-consistent.'''
-        assert self.header.point_count == self.point_used, (
+        header = self.header
+        # Resolve each parameter once, the properties below parse keys on every access
+        point_used = self.point_used
+        point_scale = self.point_scale
+        point_rate = self.point_rate
+        analog_rate = self.analog_rate
+        analog_used = self.analog_used
+
+        assert header.point_count == point_used, (
             'inconsistent point count! {} header != {} POINT:USED'.format(
-                self.header.point_count,
-                self.point_used,
+                header.point_count,
+                point_used,
             ))
 
-        assert self.header.scale_factor == self.point_scale, (
+        assert header.scale_factor == point_scale, (
             'inconsistent scale factor! {} header != {} POINT:SCALE'.format(
-                self.header.scale_factor,
-                self.point_scale,
+                header.scale_factor,
+                point_scale,
             ))
 
-        assert self.header.frame_rate == self.point_rate, (
+        assert header.frame_rate == point_rate, (
             'inconsistent frame rate! {} header != {} POINT:RATE'.format(
-                self.header.frame_rate,
-                self.point_rate,
+                header.frame_rate,
+                point_rate,
             ))
 
-        if self.point_rate:
-            ratio = self.analog_rate / self.point_rate
+        if point_rate:
+            ratio = analog_rate / point_rate
         else:
             ratio = 0
-        assert self.header.analog_per_frame == ratio, (
+        assert header.analog_per_frame == ratio, (
             'inconsistent analog rate! {} header != {} analog-fps / {} point-fps'.format(
-                self.header.analog_per_frame,
-                self.analog_rate,
-                self.point_rate,
+                header.analog_per_frame,
+                analog_rate,
+                point_rate,
             ))
 
-        count = self.analog_used * self.header.analog_per_frame
-        assert self.header.analog_count == count, (
+        count = analog_used * header.analog_per_frame
+        assert header.analog_count == count, (
             'inconsistent analog count! {} header != {} analog used * {} per-frame'.format(
-                self.header.analog_count,
-                self.analog_used,
-                self.header.analog_per_frame,
+                header.analog_count,
+                analog_used,
+                header.analog_per_frame,
             ))
 
         try:
             start = self.get_uint16('POINT:DATA_START')
-            if self.header.data_block != start:
+            if header.data_block != start:
                 warnings.warn('inconsistent data block! {} header != {} POINT:DATA_START'.format(
-                    self.header.data_block, start))
+                    header.data_block, start))
         except AttributeError:
             warnings.warn('''no pointer available in POINT:DATA_START indicating the start of the data block, using
                              header pointer as fallback''')
 
-        def check_parameters(params):
-            for name in params:
-                if self.get(name) is None:
-                    warnings.warn('missing parameter {}'.format(name))
-
-        if self.point_used > 0:
-            check_parameters(('POINT:LABELS', 'POINT:DESCRIPTIONS'))
+        required = []
+        if point_used > 0:
+            required += ['POINT:LABELS', 'POINT:DESCRIPTIONS']
         else:
             warnings.warn('No point data found in file.')
-        if self.analog_used > 0:
-            check_parameters(('ANALOG:LABELS', 'ANALOG:DESCRIPTIONS'))
+        if analog_used > 0:
+            required += ['ANALOG:LABELS', 'ANALOG:DESCRIPTIONS']
         else:
             warnings.warn('No analog data found in file.')
 
+        # Report all missing parameters in a single warning
+        missing = [name for name in required if self.get(name) is None]
+        if missing:
+            warnings.warn('missing parameters {}'.format(', '.join(missing)))
+
     def add_group(self, group_id, name, desc):
         '''Add a new parameter group.
 
@@ -909,12 +1258,14 @@ class Manager(object):
         KeyError
             If a group with a duplicate ID or name already exists.
         '''
-        if group_id in self.groups:
+        if group_id in self._groups_by_id:
             raise KeyError(group_id)
         name = name.upper()
-        if name in self.groups:
+        if name in self._groups_by_name:
             raise KeyError(name)
-        group = self.groups[name] = self.groups[group_id] = Group(name, desc)
+        group = self._groups_by_name[name] = self._groups_by_id[group_id] = Group(name, desc)
+        bisect.insort(self._group_ids, group_id)
+        self._update_groups()
         return group
 
     def get(self, group, default=None):
@@ -938,16 +1289,11 @@ class Manager(object):
             is found, returns the default value.
         '''
         if isinstance(group, int):
-            return self.groups.get(group, default)
-        group = group.upper()
-        param = None
-        if '.' in group:
-            group, param = group.split('.', 1)
-        if ':' in group:
-            group, param = group.split(':', 1)
-        if group not in self.groups:
+            return self._groups_by_id.get(group, default)
+        group, param = _parse_key(group)
+        group = self._groups_by_name.get(group)
+        if group is None:
             return default
-        group = self.groups[group]
         if param is not None:
             return group.get(param, default)
         return group
@@ -990,7 +1336,7 @@ class Manager(object):
 
     def parameter_blocks(self):
         '''Compute the size (in 512B blocks) of the parameter section.'''
-        bytes = 4. + sum(g.binary_size() for g in self.groups.values())
+        bytes = 4. + sum(g.binary_size() for g in self._groups_by_id.values())
         return int(np.ceil(bytes / 512))
 
     @property
@@ -1134,7 +1480,7 @@ class Reader(Manager):
 
         # Begin by reading the processor type:
         buf = seek_param_section_header()
-        _, _, parameter_blocks, self.processor = struct.unpack('BBBB', buf)
+        parameter_blocks, self.processor = buf[2], buf[3]
         self.dtypes = DataTypes(self.processor)
         # Convert header parameters in accordance with the processor type (MIPS format re-reads the header)
         self.header.processor_convert(self.dtypes, handle)
@@ -1142,61 +1488,198 @@ class Reader(Manager):
         # Restart reading the parameter header after parsing processor type
         buf = seek_param_section_header()
         is_mips = self.processor == PROCESSOR_MIPS
-
-        start_byte = self._handle.tell()
-        endbyte = start_byte + 512 * parameter_blocks - 4
-        while self._handle.tell() < endbyte:
-            chars_in_name, group_id = struct.unpack('bb', self._handle.read(2))
+        offset_struct = [_INT16_LE, _INT16_BE][is_mips]
+
+        # Read the parameter section in one go and parse it through a memoryview
+        mv = memoryview(self._handle.read(512 * parameter_blocks - 4))
+        pos = 0
+        endbyte = len(mv)
+        while pos < endbyte:
+            chars_in_name, group_id = _NAME_HEADER.unpack_from(mv, pos)
+            pos += 2
             if group_id == 0 or chars_in_name == 0:
                 # we've reached the end of the parameter section.
                 break
-            name = self.dtypes.decode_string(self._handle.read(abs(chars_in_name))).upper()
+            name = self.dtypes.decode_string(mv[pos:pos + abs(chars_in_name)]).upper()
+            pos += abs(chars_in_name)
 
-            # Read the byte segment associated with the parameter and create a
-            # separate binary stream object from the data.
-            offset_to_next, = struct.unpack(['<h', '>h'][is_mips], self._handle.read(2))
+            # Find the byte segment associated with the parameter.
+            offset_to_next, = offset_struct.unpack_from(mv, pos)
+            pos += 2
             if offset_to_next == 0:
                 # Last parameter, as number of bytes are unknown,
-                # read the remaining bytes in the parameter section.
-                bytes = self._handle.read(endbyte - self._handle.tell())
+                # use the remaining bytes in the parameter section.
+                next_pos = endbyte
             else:
-                bytes = self._handle.read(offset_to_next - 2)
-            buf = io.BytesIO(bytes)
+                next_pos = pos + offset_to_next - 2
 
             if group_id > 0:
                 # we've just started reading a parameter. if its group doesn't
                 # exist, create a blank one. add the parameter to the group.
-                self.groups.setdefault(
-                    group_id, Group()).add_param(name, self.dtypes, handle=buf)
+                self._groups_by_id.setdefault(group_id, Group()).add_param(
+                    name, self.dtypes, buffer=mv, offset=pos)
             else:
                 # we've just started reading a group. if a group with the
                 # appropriate id exists already (because we've already created
                 # it for a parameter), just set the name of the group.
                 # otherwise, add a new group.
                 group_id = abs(group_id)
-                size, = struct.unpack('B', buf.read(1))
-                desc = size and buf.read(size) or ''
+                size = mv[pos]
+                desc = size and mv[pos + 1:pos + 1 + size].tobytes() or ''
                 group = self.get(group_id)
                 if group is not None:
                     group.name = name
                     group.desc = desc
-                    self.groups[name] = group
+                    self._groups_by_name[name] = group
                 else:
                     self.add_group(group_id, name, desc)
+            pos = next_pos
 
+        # Groups may also have been created while reading their parameters
+        self._group_ids = sorted(self._groups_by_id)
+        self._update_groups()
         self.check_metadata()
 
-    def read_frames(self, copy=True):
+    @staticmethod
+    def _decode_points(raw, scale_mag, is_float, points):
+        '''Decode raw point words of shape (frames, points, 4) into points (frames, points, 5).'''
+        if is_float:
+            # Convert every 4 byte words to a float-32 reprensentation
+            # (the fourth column is still not a float32 representation)
+            points[..., :4] = raw
+
+            # Parse the camera-observed bits and residuals.
+            # Notes:
+            # - Invalid sample if residual is equal to -1.
+            # - A residual of 0.0 represent modeled data (filtered or interpolated).
+            # - The same format should be used internally when a float or integer representation is used,
+            #   with the difference that the words are 16 and 8 bit respectively (see the MLS guide).
+            # - While words are 16 bit, residual and camera mask is always interpreted as 8 packed in a single word!
+            # - 16 or 32 bit may represent a sign (indication that certain files write a -1 floating point only)
+            last_word = points[..., 3].astype(np.int32).view(np.uint32)
+            valid = (last_word & 0x80008000) == 0
+            points[~valid, 3:5] = -1.0
+            c = last_word[valid]
+
+        else:
+            # Read point 2 byte words in int-16 format, unit scales are copied as is
+            if scale_mag == 1:
+                points[..., :3] = raw[..., :3]
+            else:
+                points[..., :3] = raw[..., :3] * scale_mag
+
+            # Parse last 16-bit word as two 8-bit words
+            valid = raw[..., 3] > -1
+            points[~valid, 3:5] = -1
+            c = raw[..., 3][valid]
+
+        # Convert coordinate data
+        # fourth value is floating-point (scaled) error estimate (residual)
+        residual = (c & 0xff).astype(np.float32)
+        if scale_mag != 1:
+            residual *= scale_mag
+        points[valid, 3] = residual
+
+        # fifth value is number of bits set in camera-observation byte (bit 8 to 14)
+        # (a single table lookup on the high byte, the table masks out bit 15)
+        points[valid, 4] = _CAM_POPCOUNT[(c >> 8).astype(np.uint8)]
+        # Get value as is: points[valid, 4] = (c >> 8)
+
+    def _read_frame_batches(self, frame_dtype, nframes):
+        '''Read up to `nframes` frames of the given layout from the current handle position.
+
+        Frames are generated in batches of at most `_READ_BATCH_FRAMES` frames.
+        Regular files are memory-mapped, other handles (streams, compressed
+        files, in-memory buffers) are read into a single frame buffer that is reused for every
+        batch, so each batch must be consumed before the next one is read.
+        Incomplete frames at the end of the file are dropped.
+        '''
+        if not nframes:
+            return
+        handle = self._handle
+        frame_bytes = frame_dtype.itemsize
+        batch_frames = min(nframes, _READ_BATCH_FRAMES)
+        if not frame_bytes:
+            # Frames without any data words
+            raw_frames = np.zeros(batch_frames, dtype=frame_dtype)
+            for start in range(0, nframes, batch_frames):
+                yield raw_frames[:nframes - start]
+            return
+
+        offset = handle.tell()
+        st = None
+        # Only plain file objects read the bytes of their file descriptor, compressed
+        # file objects (gzip, bz2, lzma) also report the descriptor of the file
+        if isinstance(handle, (io.FileIO, io.BufferedReader, io.BufferedRandom)):
+            try:
+                st = os.fstat(handle.fileno())
+            except (OSError, ValueError):
+                pass
+        if st is not None and stat.S_ISREG(st.st_mode):
+            end = min(offset + nframes * frame_bytes, max(st.st_size, offset))
+            nread = (end - offset) // frame_bytes
+            raw_frames = np.empty(0, dtype=frame_dtype)
+            if nread:
+                raw_frames = np.memmap(handle, dtype=frame_dtype, mode='r', offset=offset, shape=(nread,))
+            # Leave the handle where a plain read would have left it
+            handle.seek(end)
+            for start in range(0, nread, batch_frames):
+                yield raw_frames[start:start + batch_frames]
+            return
+
+        raw_frames = np.empty(batch_frames, dtype=frame_dtype)
+        buffer = memoryview(raw_frames.view(np.uint8))
+        readinto = getattr(handle, 'readinto', None)
+        for start in range(0, nframes, batch_frames):
+            size = min(batch_frames, nframes - start) * frame_bytes
+            nbytes = 0
+            while nbytes < size:
+                if readinto is not None:
+                    n = readinto(buffer[nbytes:size])
+                else:
+                    chunk = handle.read(size - nbytes)
+                    n = len(chunk)
+                    buffer[nbytes:nbytes + n] = chunk
+                if not n:
+                    break
+                nbytes += n
+            if nbytes >= frame_bytes:
+                yield raw_frames[:nbytes // frame_bytes]
+            if nbytes < size:
+                return
+
+    @staticmethod
+    def _decode_analog(raw, gain, bias, analog):
+        '''Decode raw analog words of shape (frames, samples, channels) into analog (frames, channels, samples).'''
+        analog[...] = raw.transpose((0, 2, 1))
+        # Convert analog, skipping the steps that are an identity for this file
+        if (gain != 1).any():
+            analog *= gain
+        if bias.any():
+            analog -= bias
+
+    def read_frames(self, copy=True, out_points=None, out_analog=None):
         '''Iterate over the data frames from our C3D file handle.
 
         Parameters
         ----------
         copy : bool
-            If False, the reader returns a reference to the same data buffers
-            for every frame. The default is True, which causes the reader to
-            return a unique data buffer for each frame. Set this to False if you
-            consume frames as you iterate over them, or True if you store them
-            for later.
+            Frames are decoded to float32 in batches of up to 1024 frames, the
+            first batch on the first call to ``next()``. If False, the reader
+            returns views into the decoded batch, a distinct view for each
+            frame, and the batch buffer is overwritten when the next batch is
+            decoded. The default is True, which causes the reader to return a
+            unique data buffer for each frame. Set this to False if you consume
+            frames as you iterate over them, or True if you store them for
+            later.
+        out_points : ndarray, optional
+            Array of shape (points, 5) that receives the point data of each
+            frame. If given, this same array is overwritten and returned for
+            every frame (regardless of `copy`), so it must be consumed before
+            advancing the iterator.
+        out_analog : ndarray, optional
+            Array of shape (channels, samples per frame) that receives the
+            analog data of each frame, reused in the same way as `out_points`.
 
         Returns
         -------
@@ -1218,16 +1701,20 @@ class Reader(Manager):
         '''
         # Point magnitude scalar, if scale parameter is < 0 data is floating point
         # (in which case the magnitude is the absolute value)
-        scale_mag = abs(self.point_scale)
-        is_float = self.point_scale < 0
+        point_scale = self.point_scale
+        scale_mag = abs(point_scale)
+        is_float = point_scale < 0
+        is_dec = self.processor == PROCESSOR_DEC
+
+        # Resolve the data layout once, everything below works on local values
+        point_used = int(self.point_used)
+        analog_used = int(self.analog_used)
+        analog_per_frame = self.analog_per_frame
 
         if is_float:
-            point_word_bytes = 4
-            point_dtype = self.dtypes.uint32
+            point_dtype = self.dtypes.float32
         else:
-            point_word_bytes = 2
             point_dtype = self.dtypes.int16
-        points = np.zeros((self.point_used, 5), np.float32)
 
         # TODO: handle ANALOG:BITS parameter here!
         p = self.get('ANALOG:FORMAT')
@@ -1247,111 +1734,100 @@ class Reader(Manager):
             analog_dtype = self.dtypes.int16
             analog_word_bytes = 2
 
-        analog = np.array([], float)
-        offsets = np.zeros((self.analog_used, 1), int)
+        offsets = np.zeros((analog_used, 1), int)
         param = self.get('ANALOG:OFFSET')
         if param is not None:
-            offsets = param.int16_array[:self.analog_used, None]
+            offsets = param.int16_array[:analog_used, None]
 
-        analog_scales = np.ones((self.analog_used, 1), float)
+        analog_scales = np.ones((analog_used, 1), float)
         param = self.get('ANALOG:SCALE')
         if param is not None:
-            analog_scales[:, :] = param.float_array[:self.analog_used, None]
+            analog_scales[:, :] = param.float_array[:analog_used, None]
 
         gen_scale = 1.
         param = self.get('ANALOG:GEN_SCALE')
         if param is not None:
             gen_scale = param.float_value
 
+        # Fold the conversion into a single gain and bias per channel:
+        # (raw - offset) * scale * gen_scale == raw * gain - bias
+        analog_gain = analog_scales * gen_scale
+        analog_bias = (offsets * analog_gain).astype(np.float32)
+        analog_gain = analog_gain.astype(np.float32)
+
         # Seek to the start point of the data blocks
         self._handle.seek((self.header.data_block - 1) * 512)
-        # Number of values (words) read in regard to POINT/ANALOG data
-        N_point = 4 * self.point_used
-        N_analog = self.analog_used * self.analog_per_frame
-        # Total bytes per frame
-        point_bytes = N_point * point_word_bytes
-        analog_bytes = N_analog * analog_word_bytes
-        # Parse the data blocks
-        for frame_no in range(self.first_frame, self.last_frame + 1):
-            # Read the byte data (used) for the block
-            raw_bytes = self._handle.read(N_point * point_word_bytes)
-            raw_analog = self._handle.read(N_analog * analog_word_bytes)
-            # Verify read pointers (any of the two can be assumed to be 0)
-            if len(raw_bytes) < point_bytes:
-                warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
-                return
-            if len(raw_analog) < analog_bytes:
-                warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
-                return
+        # Number of analog values (words) in a frame
+        N_analog = analog_used * analog_per_frame
+        # Layout of a single frame, point words are followed by the analog words
+        if is_float and is_dec:
+            # DEC floats are converted from the raw 32 bit words
+            point_dtype = analog_dtype = self.dtypes.uint32
+        frame_dtype = np.dtype([('point', point_dtype, (point_used, 4)),
+                                ('analog', analog_dtype, (N_analog,))])
+        frame_range = range(self.first_frame, self.last_frame + 1)
+        nframes = len(frame_range)
+
+        # Decoded frames are records holding the points and analog data of a frame
+        # in one contiguous block, a copied frame is then a single allocation.
+        # The records are decoded in batches and the buffer is reused for every batch.
+        analog_shape = (analog_used, analog_per_frame) if N_analog > 0 else (0,)
+        decoded = np.zeros(min(nframes, _READ_BATCH_FRAMES),
+                           dtype=[('points', np.float32, (point_used, 5)),
+                                  ('analog', np.float32, analog_shape)])
+
+        index = 0
+        for raw_frames in self._read_frame_batches(frame_dtype, nframes):
+            nread = len(raw_frames)
+            # Raw words of the batch, DEC floats are converted to IEEE floats first
+            if is_float and is_dec:
+                raw_points = DEC_to_IEEE_BYTES(raw_frames['point'].tobytes()).reshape((nread, point_used, 4))
+                raw_analog = DEC_to_IEEE_BYTES(raw_frames['analog'].tobytes())
+            else:
+                raw_points = raw_frames['point']
+                raw_analog = raw_frames['analog']
+            raw_analog = raw_analog.reshape((nread, analog_per_frame, analog_used))
 
-            if is_float:
-                # Convert every 4 byte words to a float-32 reprensentation
-                # (the fourth column is still not a float32 representation)
-                if self.processor == PROCESSOR_DEC:
-                    # Convert each of the first 6 16-bit words from DEC to IEEE float
-                    points[:, :4] = DEC_to_IEEE_BYTES(raw_bytes).reshape((self.point_used, 4))
-                else:  # If IEEE or MIPS:
-                    # Re-read the raw byte representation directly
-                    points[:, :4] = np.frombuffer(raw_bytes,
-                                                  dtype=self.dtypes.float32,
-                                                  count=N_point).reshape((int(self.point_used), 4))
-
-                # Parse the camera-observed bits and residuals.
-                # Notes:
-                # - Invalid sample if residual is equal to -1.
-                # - A residual of 0.0 represent modeled data (filtered or interpolated).
-                # - The same format should be used internally when a float or integer representation is used,
-                #   with the difference that the words are 16 and 8 bit respectively (see the MLS guide).
-                # - While words are 16 bit, residual and camera mask is always interpreted as 8 packed in a single word!
-                # - 16 or 32 bit may represent a sign (indication that certain files write a -1 floating point only)
-                last_word = points[:, 3].astype(np.int32)
-                valid = (last_word & 0x80008000) == 0
-                points[~valid, 3:5] = -1.0
-                c = last_word[valid]
+            frames = decoded[:nread]
+            points = frames['points']
+            analog = frames['analog']
 
-            else:
-                # Convert the bytes to a unsigned 32 bit or signed 16 bit representation
-                raw = np.frombuffer(raw_bytes,
-                                    dtype=point_dtype,
-                                    count=N_point).reshape((self.point_used, 4))
-                # Read point 2 byte words in int-16 format
-                points[:, :3] = raw[:, :3] * scale_mag
-
-                # Parse last 16-bit word as two 8-bit words
-                valid = raw[:, 3] > -1
-                points[~valid, 3:5] = -1
-                c = raw[valid, 3].astype(self.dtypes.uint16)
-
-            # Convert coordinate data
-            # fourth value is floating-point (scaled) error estimate (residual)
-            points[valid, 3] = (c & 0xff).astype(np.float32) * scale_mag
-
-            # fifth value is number of bits set in camera-observation byte
-            points[valid, 4] = sum((c & (1 << k)) >> k for k in range(8, 15))
-            # Get value as is: points[valid, 4] = (c >> 8)
-
-            # Check if analog data exist, and parse if so
+            # Decode the batch at once, with the decoder specialized for the presence of analog data
             if N_analog > 0:
-                if is_float and self.processor == PROCESSOR_DEC:
-                    # Convert each of the 16-bit words from DEC to IEEE float
-                    analog = DEC_to_IEEE_BYTES(raw_analog)
+                if _decode_frames_jit is not None:
+                    # Compiled decoder (numba is available), operates on native byte order
+                    _decode_frames_jit(_native(raw_points), _native(raw_analog), scale_mag, is_float,
+                                       analog_gain[:, 0], analog_bias[:, 0], points, analog)
                 else:
-                    # Integer or INTEL/MIPS floating point data can be parsed directly
-                    analog = np.frombuffer(raw_analog, dtype=analog_dtype, count=N_analog)
-
-                # Reformat and convert
-                analog = analog.reshape((-1, self.analog_used)).T
-                analog = analog.astype(float)
-                # Convert analog
-                analog = (analog - offsets) * analog_scales * gen_scale
+                    self._decode_points(raw_points, scale_mag, is_float, points)
+                    self._decode_analog(raw_analog, analog_gain, analog_bias, analog)
+            else:
+                if _decode_points_jit is not None:
+                    _decode_points_jit(_native(raw_points), scale_mag, is_float, points)
+                else:
+                    self._decode_points(raw_points, scale_mag, is_float, points)
 
             # Output buffers
-            if copy:
-                yield frame_no, points.copy(), analog  # .copy(), a new array is generated per frame for analog data.
-            else:
-                yield frame_no, points, analog
+            for i in range(nread):
+                frame = frames[i:i + 1]
+                if copy and (out_points is None or out_analog is None):
+                    frame = frame.copy()
+                frame_points = frame['points'][0]
+                frame_analog = frame['analog'][0]
+                if out_points is not None:
+                    np.copyto(out_points, frame_points)
+                    frame_points = out_points
+                if out_analog is not None:
+                    np.copyto(out_analog, frame_analog)
+                    frame_analog = out_analog
+                yield frame_range[index], frame_points, frame_analog
+                index += 1
+
+        # Verify that all frames were read (the file may be truncated)
+        if index < nframes:
+            warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
+                             and file pointer {}!'''.format(index, self._handle.tell()))
+            return
 
         # Function evaluating EOF, note that data section is written in blocks of 512
         final_byte_index = self._handle.tell()
@@ -1382,6 +1858,15 @@ class Writer(Manager):
     >>> with open('smoothed.c3d', 'wb') as handle:
     >>>     w.write(handle)
 
+    Frames can also be streamed to the file as they are added, without
+    keeping them in memory::
+
+    >>> w = c3d.Writer()
+    >>> with open('smoothed.c3d', 'wb') as handle:
+    >>>     w.begin(handle, r.point_labels)
+    >>>     w.add_frames(process_frames_somehow(r.read_frames()))
+    >>>     w.finalize()
+
     Parameters
     ----------
     point_rate : float, optional
@@ -1413,23 +1898,135 @@ class Writer(Manager):
         self._point_scale = point_scale
         self._point_units = point_units
         self._gen_scale = gen_scale
-        self._frames = []
+        # Frames added before writing, kept as blocks of arrays per point attribute
+        self._blocks = []
+        self._handle = None
 
     def add_frames(self, frames):
         '''Add frames to this writer instance.
 
+        If the writer is streaming to a file handle (see :meth:`begin`), the
+        frames are written right away, otherwise they are kept until
+        :meth:`write` is called.
+
         Parameters
         ----------
         frames : sequence of (point, analog) tuples
             A sequence of frame data to add to the writer.
         '''
-        self._frames.extend(frames)
+        if self._handle is not None:
+            frames = iter(frames)
+            batch = list(itertools.islice(frames, _WRITE_BATCH_FRAMES))
+            while batch:
+                self._write_frames(*self._frames_to_soa(batch))
+                batch = list(itertools.islice(frames, _WRITE_BATCH_FRAMES))
+        else:
+            frames = list(frames)
+            if frames:
+                self._blocks.append(self._frames_to_soa(frames))
+
+    def add_frames_soa(self, xyz, residuals, camera_mask, analog=None):
+        '''Add frames given as separate arrays for each point attribute.
+
+        The arrays cover a whole sequence of frames and are kept by reference
+        (or written right away when streaming, see :meth:`begin`), without
+        splitting them into per-frame arrays.
+
+        Parameters
+        ----------
+        xyz : ndarray
+            Point coordinates, shape (frames, points, 3).
+        residuals : ndarray
+            Point residuals, shape (frames, points). Points with a residual of
+            -1 are invalid.
+        camera_mask : ndarray
+            Bit mask of the cameras (bit 0 to 6) that observed each point,
+            shape (frames, points).
+        analog : ndarray, optional
+            Analog data, shape (frames, channels, samples per frame).
+        '''
+        if analog is None or not np.size(analog):
+            analog = np.zeros((len(xyz), 0, 0), np.float32)
+        if self._handle is not None:
+            for i in range(0, len(xyz), _WRITE_BATCH_FRAMES):
+                batch = slice(i, i + _WRITE_BATCH_FRAMES)
+                self._write_frames(xyz[batch], residuals[batch], camera_mask[batch], analog[batch])
+        elif len(xyz):
+            self._blocks.append((xyz, residuals, camera_mask, analog))
+
+    @staticmethod
+    def _frames_to_soa(frames):
+        '''Split a sequence of (points, analog) frames into arrays per point attribute.'''
+        points = np.array([p for p, _ in frames], dtype=np.float32)
+        # The camera count is stored as a mask of that many cameras
+        camera_mask = (1 << np.clip(points[..., 4], 0, 7).astype(np.uint16)) - 1
+        analog = np.array([a for _, a in frames], dtype=np.float32)
+        if analog.size == 0:
+            # Frames without analog data, e.g. the (0,) arrays of Reader.read_frames
+            analog = analog.reshape((len(frames), 0, 0))
+        elif analog.ndim == 2:
+            # A single sample per channel
+            analog = analog[..., None]
+        return points[..., :3], points[..., 3], camera_mask, analog
+
+    def begin(self, handle, labels):
+        '''Start streaming frames to a file handle.
+
+        Frames added after this call are encoded and written as they are added,
+        instead of being kept in memory. The metadata is written along with the
+        first frame, call :meth:`finalize` once all frames are added to record
+        the number of frames written.
+
+        Parameters
+        ----------
+        handle : file
+            Write metadata and C3D motion frames to the given file handle. The
+            handle must be seekable and the writer does not close it.
+        labels : sequence of str
+            Labels of the points in each frame.
+        '''
+        self._handle = handle
+        self._labels = labels
+        self._frame_count = 0
+        self._expected_frames = 0
+
+    def add_frame(self, points, analog):
+        '''Write a single frame to the file handle given to :meth:`begin`.
+
+        Parameters
+        ----------
+        points : ndarray
+            Point data of the frame, shape (points, 5).
+        analog : ndarray
+            Analog data of the frame, shape (channels, samples per frame).
+        '''
+        self._write_frames(*self._frames_to_soa([(points, analog)]))
+
+    def finalize(self):
+        '''Finish streaming frames to the file handle given to :meth:`begin`.
+
+        Pads the data section to a full block and, if needed, updates the
+        frame count in the header and parameter section written earlier. The
+        handle is left at the end of the file.
+        '''
+        handle = self._handle
+        self._handle = None
+        if not self._frame_count:
+            return
+        self._pad_block(handle)
+        if self._frame_count != self._expected_frames:
+            end = handle.tell()
+            self._set_frame_count(self._frame_count)
+            self.header.write(handle)
+            handle.seek(512)
+            self._write_groups(handle)
+            handle.seek(end)
 
     def _pad_block(self, handle):
         '''Pad the file with 0s to the end of the next block boundary.'''
         extra = handle.tell() % 512
         if extra:
-            handle.write(b'\x00' * (512 - extra))
+            handle.write(_ZERO_BLOCK[:512 - extra])
 
     def _write_metadata(self, handle):
         '''Write metadata to a file handle.
@@ -1448,54 +2045,85 @@ class Writer(Manager):
         assert handle.tell() == 512
 
         # groups
-        handle.write(struct.pack(
-            'BBBB', 0, 0, self.parameter_blocks(), PROCESSOR_INTEL))
-        id_groups = sorted(
-            (i, g) for i, g in self.groups.items() if isinstance(i, int))
-        for group_id, group in id_groups:
-            group.write(group_id, handle)
+        self._write_groups(handle)
 
         # padding
         self._pad_block(handle)
-        while handle.tell() != 512 * (self.header.data_block - 1):
-            handle.write(b'\x00' * 512)
-
-    def _write_frames(self, handle):
-        '''Write our frame data to the given file handle.
-
-        Parameters
-        ----------
-        handle : file
-            Write metadata and C3D motion frames to the given file handle. The
-            writer does not close the handle.
-        '''
-        assert handle.tell() == 512 * (self.header.data_block - 1)
+        data_start = 512 * (self.header.data_block - 1)
+        if handle.tell() < data_start:
+            # Writing the last byte extends the file, the gap is filled with zeros
+            handle.seek(data_start - 1)
+            handle.write(b'\x00')
+
+    def _write_groups(self, handle):
+        '''Write the parameter section, without padding, to a file handle.'''
+        # The parameter blocks are counted once, when the data block is assigned
+        blocks = self.header.data_block - self.header.parameter_block
+        handle.write(_SECTION_HEADER.pack(0, 0, blocks, PROCESSOR_INTEL))
+        for group_id in self._group_ids:
+            self._groups_by_id[group_id].write(group_id, handle)
+
+    def _begin_frames(self, analog_shape):
+        '''Set up the encoding of frames, once the metadata is known.'''
         scale = abs(self.point_scale)
-        is_float = self.point_scale < 0
-        if is_float:
+        self._is_float = self.point_scale < 0
+        if self._is_float:
             point_dtype = np.float32
-            point_format = 'f'
-            point_scale = 1.0
+            self._inv_point_scale = np.float32(1.)
         else:
             point_dtype = np.int16
-            point_format = 'i'
-            point_scale = scale
-        raw = np.empty((self.point_used, 4), point_dtype)
-        for points, analog in self._frames:
-            valid = points[:, 3] > -1
-            raw[~valid, 3] = -1
-            raw[valid, :3] = points[valid, :3] / point_scale
-            raw[valid, 3] = (
-                ((points[valid, 4]).astype(np.uint8) << 8) |
-                (points[valid, 3] / scale).astype(np.uint16)
-            )
-            point = array.array(point_format)
-            point.extend(raw.flatten())
-            point.tofile(handle)
-            analog = array.array(point_format)
-            analog.extend(analog)
-            analog.tofile(handle)
-        self._pad_block(handle)
+            self._inv_point_scale = np.float32(1. / scale)
+        self._inv_scale = np.float32(1. / scale)
+        # Layout of a single frame, analog samples are stored sample by sample
+        channels, samples = analog_shape
+        self._frame_dtype = np.dtype([('point', point_dtype, (self.point_used, 4)),
+                                      ('analog', point_dtype, (samples, channels))])
+
+    def _write_frames(self, xyz, residuals, camera_mask, analog):
+        '''Encode a batch of frames, given per point attribute, and write them.'''
+        _write_buffers(self._handle, [self._encode_frames(xyz, residuals, camera_mask, analog)])
+
+    def _encode_frames(self, xyz, residuals, camera_mask, analog):
+        '''Encode a batch of frames, given per point attribute, in one pass.
+
+        Metadata is written to the handle along with the first batch.
+
+        Returns
+        -------
+        encoded : ndarray
+            Encoded frames, as a structured array holding the file layout.
+        '''
+        if self._frame_count == 0:
+            self._add_metadata(self._labels, xyz.shape[1], analog.shape[1:], self._expected_frames)
+            self._write_metadata(self._handle)
+            self._begin_frames(analog.shape[1:])
+
+        # Encode in single precision, the stored words are float32 or int16
+        xyz = np.asarray(xyz, dtype=np.float32)
+        residuals = np.asarray(residuals, dtype=np.float32)
+        encoded = np.empty(len(xyz), self._frame_dtype)
+        raw = encoded['point']
+        # Encode every point, then select invalid points with a single pass per column
+        valid = residuals > -1
+        if not self._is_float:
+            # Round to the nearest integer step, assignment would truncate
+            xyz = np.rint(xyz * self._inv_point_scale)
+        np.copyto(raw[..., :3], np.where(valid[..., None], xyz, 0), casting='unsafe')
+        # Pack the camera mask above the residual byte, invalid points are stored as -1
+        word = (camera_mask.astype(np.int32) & 0x7f) << 8
+        word |= np.rint(residuals * self._inv_scale).astype(np.int32)
+        np.copyto(raw[..., 3], np.where(valid, word, -1), casting='unsafe')
+        if encoded['analog'].size:
+            encoded['analog'] = analog.transpose((0, 2, 1))
+
+        self._frame_count += len(xyz)
+        return encoded
+
+    def _set_frame_count(self, count):
+        '''Store the number of frames in the header and parameters.'''
+        self.get('POINT:FRAMES').bytes = _UINT16_LE.pack(min(65535, count))
+        self.get('TRIAL:ACTUAL_END_FIELD').bytes = _UINT32_LE.pack(count)
+        self.header.last_frame = np.uint16(min(count, 65535))
 
     def write(self, handle, labels):
         '''Write metadata and point + analog frames to a file handle.
@@ -1506,17 +2134,35 @@ class Writer(Manager):
             Write metadata and C3D motion frames to the given file handle. The
             writer does not close the handle.
         '''
-        if not self._frames:
+        if not self._blocks:
             return
 
+        self.begin(handle, labels)
+        self._expected_frames = sum(len(block[0]) for block in self._blocks)
+        encoded = []
+        for xyz, residuals, camera_mask, analog in self._blocks:
+            for i in range(0, len(xyz), _WRITE_BATCH_FRAMES):
+                batch = slice(i, i + _WRITE_BATCH_FRAMES)
+                encoded.append(self._encode_frames(
+                    xyz[batch], residuals[batch], camera_mask[batch], analog[batch]))
+                # Batches are written in groups, a single system call for regular
+                # files, which bounds the encoded frames held in memory
+                if len(encoded) == _IOV_MAX:
+                    _write_buffers(handle, encoded)
+                    encoded = []
+        _write_buffers(handle, encoded)
+        self.finalize()
+
+    def _add_metadata(self, labels, ppf, analog_shape, frame_count):
+        '''Create the parameter groups and header for frames of the given shape.'''
         dtypes = DataTypes(PROCESSOR_INTEL)
 
-        def add(name, desc, bpe, format, bytes, *dimensions):
+        def add(name, desc, bpe, packer, bytes, *dimensions):
             group.add_param(name,
                             dtypes,
                             desc=desc,
                             bytes_per_element=bpe,
-                            bytes=struct.pack(format, bytes),
+                            bytes=packer.pack(bytes),
                             dimensions=list(dimensions))
 
         def add_str(name, desc, bytes, *dimensions):
@@ -1524,62 +2170,63 @@ class Writer(Manager):
                             dtypes,
                             desc=desc,
                             bytes_per_element=-1,
-                            bytes=bytes.encode('utf-8'),
+                            bytes=_encode(bytes),
                             dimensions=list(dimensions))
 
-        def add_empty_array(name, desc, bpe):
+        def add_array(name, desc, values):
             group.add_param(name, dtypes, desc=desc,
-                            bytes_per_element=bpe, dimensions=[0])
+                            bytes_per_element=values.itemsize,
+                            bytes=values.tobytes(),
+                            dimensions=[len(values)])
 
-        points, analog = self._frames[0]
-        ppf = len(points)
         labels = np.ravel(labels)
 
         # POINT group
 
-        # Get longest label name
-        label_max_size = 0
-        label_max_size = max(label_max_size, np.max([len(label) for label in labels]))
+        # Encode each label once, the longest one sets the column width
+        encoded = [_encode(labels[i]) for i in range(ppf)]
+        label_max_size = max([0] + [len(label) for label in encoded])
+        # Fill a single space-padded buffer rather than joining padded strings
+        label_bytes = bytearray(b' ' * (label_max_size * ppf))
+        for i, label in enumerate(encoded):
+            label_bytes[i * label_max_size:i * label_max_size + len(label)] = label
 
         group = self.add_group(1, 'POINT', 'POINT group')
-        add('USED', 'Number of 3d markers', 2, '<H', ppf)
-        add('FRAMES', 'frame count', 2, '<H', min(65535, len(self._frames)))
-        add('DATA_START', 'data block number', 2, '<H', 0)
-        add('SCALE', '3d scale factor', 4, '<f', np.float32(self._point_scale))
-        add('RATE', '3d data capture rate', 4, '<f', np.float32(self._point_rate))
+        add('USED', 'Number of 3d markers', 2, _UINT16_LE, ppf)
+        add('FRAMES', 'frame count', 2, _UINT16_LE, min(65535, frame_count))
+        add('DATA_START', 'data block number', 2, _UINT16_LE, 0)
+        add('SCALE', '3d scale factor', 4, _FLOAT32_LE, np.float32(self._point_scale))
+        add('RATE', '3d data capture rate', 4, _FLOAT32_LE, np.float32(self._point_rate))
         add_str('X_SCREEN', 'X_SCREEN parameter', '+X', 2)
         add_str('Y_SCREEN', 'Y_SCREEN parameter', '+Y', 2)
         add_str('UNITS', '3d data units',
                 self._point_units, len(self._point_units))
 
-        add_str('LABELS', 'labels', ''.join(labels[i].ljust(label_max_size)
-                for i in range(ppf)), label_max_size, ppf)
-        add_str('DESCRIPTIONS', 'descriptions', ' ' * 16 * ppf, 16, ppf)
+        add_str('LABELS', 'labels', bytes(label_bytes), label_max_size, ppf)
+        add_str('DESCRIPTIONS', 'descriptions', b' ' * (16 * ppf), 16, ppf)
 
         # ANALOG group
         group = self.add_group(2, 'ANALOG', 'ANALOG group')
-        add('USED', 'analog channel count', 2, '<H', analog.shape[0])
-        add('RATE', 'analog samples per second', 4, '<f', np.float32(self._analog_rate))
-        add('GEN_SCALE', 'analog general scale factor', 4, '<f', np.float32(self._gen_scale))
-        add_empty_array('SCALE', 'analog channel scale factors', 4)
-        add_empty_array('OFFSET', 'analog channel offsets', 2)
+        add('USED', 'analog channel count', 2, _UINT16_LE, analog_shape[0])
+        add('RATE', 'analog samples per second', 4, _FLOAT32_LE, np.float32(self._analog_rate))
+        add('GEN_SCALE', 'analog general scale factor', 4, _FLOAT32_LE, np.float32(self._gen_scale))
+        # Samples are written as is, with unit scale and no offset for each channel
+        add_array('SCALE', 'analog channel scale factors', np.ones(analog_shape[0], '<f4'))
+        add_array('OFFSET', 'analog channel offsets', np.zeros(analog_shape[0], '<i2'))
 
         # TRIAL group
         group = self.add_group(3, 'TRIAL', 'TRIAL group')
-        add('ACTUAL_START_FIELD', 'actual start frame', 2, '<I', 1, 2)
-        add('ACTUAL_END_FIELD', 'actual end frame', 2, '<I', len(self._frames), 2)
+        add('ACTUAL_START_FIELD', 'actual start frame', 2, _UINT32_LE, 1, 2)
+        add('ACTUAL_END_FIELD', 'actual end frame', 2, _UINT32_LE, frame_count, 2)
 
         # sync parameter information to header.
         blocks = self.parameter_blocks()
-        self.get('POINT:DATA_START').bytes = struct.pack('<H', 2 + blocks)
+        self.get('POINT:DATA_START').bytes = _UINT16_LE.pack(2 + blocks)
 
         self.header.data_block = np.uint16(2 + blocks)
         self.header.frame_rate = np.float32(self._point_rate)
-        self.header.last_frame = np.uint16(min(len(self._frames), 65535))
+        self.header.last_frame = np.uint16(min(frame_count, 65535))
         self.header.point_count = np.uint16(ppf)
-        self.header.analog_count = np.uint16(np.prod(analog.shape))
+        self.header.analog_count = np.uint16(np.prod(analog_shape))
         self.header.analog_per_frame = np.uint16(self._analog_per_frame)
         self.header.scale_factor = np.float32(self._point_scale)
-
-        self._write_metadata(handle)
-        self._write_frames(handle)
@@ -1,7 +1,12 @@
 import c3d
+import gzip
 import importlib
 import io
+import numpy as np
+import os
+import tempfile
 import unittest
+from unittest import mock
 from test.base import Base
 from test.zipload import Zipload
 climate_spec = importlib.util.find_spec("climate")
@@ -96,5 +101,241 @@ class WriterTest(Base):
         w.write(h, r.point_labels)
 
 
+class ManagerTest(unittest.TestCase):
+    def test_groups_mapping(self):
+        m = c3d.Manager()
+        groups = m.groups
+        assert m.groups is groups
+        assert len(groups) == 0
+        g = m.add_group(1, 'point', 'point group')
+        assert m.groups is not groups
+        assert m.groups['POINT'] is g
+        assert m.groups[1] is g
+        with self.assertRaises(TypeError):
+            m.groups['ANALOG'] = c3d.Group('ANALOG')
+
+
+def gen_frames(nframes=20, npoints=6, scale=-1., seed=0):
+    ''' Generate (points, analog) frames without analog data, the first point of
+        each frame is invalid.
+    '''
+    rng = np.random.default_rng(seed)
+    frames = []
+    for _ in range(nframes):
+        points = np.zeros((npoints, 5), np.float32)
+        points[:, :3] = rng.integers(-1000, 1000, (npoints, 3)) * abs(scale)
+        points[:, 3] = rng.integers(0, 100, npoints) * abs(scale)
+        points[:, 4] = rng.integers(0, 8, npoints)
+        points[0, 3:] = -1
+        frames.append((points, np.array([])))
+    return frames
+
+
+def write_frames(frames, scale=-1., labels=None):
+    ''' Write frames to an in-memory C3D file and return its bytes.
+    '''
+    w = c3d.Writer(point_rate=100., point_scale=scale)
+    w.add_frames(frames)
+    h = io.BytesIO()
+    w.write(h, labels or ['M%d' % i for i in range(len(frames[0][0]))])
+    return h.getvalue()
+
+
+class WriterFramesTest(unittest.TestCase):
+    def test_no_analog_roundtrip(self):
+        frames = gen_frames()
+        r = c3d.Reader(io.BytesIO(write_frames(frames)))
+        read = list(r.read_frames())
+        assert len(read) == len(frames)
+        for (_, points, analog), (expected, _) in zip(read, frames):
+            assert analog.size == 0
+            # Invalid points are stored without coordinates
+            np.testing.assert_allclose(points[1:], expected[1:])
+            np.testing.assert_allclose(points[0, 3:], -1)
+
+        # Frames as yielded by the reader can be written again
+        w = c3d.Writer(point_rate=100., point_scale=-1.)
+        w.add_frames((p, a) for _, p, a in read)
+        h = io.BytesIO()
+        w.write(h, r.point_labels)
+        assert h.getvalue() == write_frames(frames, labels=list(r.point_labels))
+
+    def test_analog_roundtrip(self):
+        rng = np.random.default_rng(2)
+        for scale in (0.1, -1.):
+            frames = [(points, rng.integers(-1000, 1000, (3, 4)).astype(np.float32))
+                      for points, _ in gen_frames(scale=scale)]
+            w = c3d.Writer(point_rate=100., analog_rate=400., point_scale=scale)
+            w.add_frames(frames)
+            h = io.BytesIO()
+            w.write(h, ['M%d' % i for i in range(6)])
+            h.seek(0)
+            r = c3d.Reader(h)
+            assert r.analog_used == 3
+            read = list(r.read_frames())
+            assert len(read) == len(frames)
+            for (_, points, analog), (p, a) in zip(read, frames):
+                np.testing.assert_allclose(points[1:], p[1:], atol=abs(scale) / 2)
+                np.testing.assert_array_equal(analog, a)
+
+    def test_stream(self):
+        frames = gen_frames()
+        w = c3d.Writer(point_rate=100., point_scale=-1.)
+        h = io.BytesIO()
+        w.begin(h, ['M%d' % i for i in range(6)])
+        for points, analog in frames:
+            w.add_frame(points, analog)
+        w.finalize()
+        # The frame count is only known, and rewritten, when finalizing
+        assert h.getvalue() == write_frames(frames)
+
+    def test_stream_unknown_count(self):
+        frames = gen_frames(nframes=2500, scale=0.1)
+        w = c3d.Writer(point_rate=100., point_scale=0.1)
+        h = io.BytesIO()
+        w.begin(h, ['M%d' % i for i in range(6)])
+        w.add_frames(iter(frames))
+        w.finalize()
+        h.seek(0)
+        r = c3d.Reader(h)
+        assert r.frame_count == len(frames)
+        assert len(list(r.read_frames(copy=False))) == len(frames)
+
+    def write_soa(self, scale, xyz, residuals, camera_mask):
+        w = c3d.Writer(point_rate=100., point_scale=scale)
+        w.add_frames_soa(xyz, residuals, camera_mask)
+        h = io.BytesIO()
+        w.write(h, ['M%d' % i for i in range(xyz.shape[1])])
+        return h.getvalue()
+
+    def test_soa_roundtrip(self):
+        rng = np.random.default_rng(1)
+        for scale in (0.1, -1.):
+            xyz = (rng.integers(-1000, 1000, (30, 4, 3)) * abs(scale)).astype(np.float32)
+            residuals = (rng.integers(0, 100, (30, 4)) * abs(scale)).astype(np.float32)
+            residuals[:, 1] = -1
+            camera_mask = rng.integers(0, 128, (30, 4)).astype(np.uint16)
+            r = c3d.Reader(io.BytesIO(self.write_soa(scale, xyz, residuals, camera_mask)))
+            points = np.array([p for _, p, _ in r.read_frames()])
+            assert points.shape == (30, 4, 5)
+            valid = residuals > -1
+            np.testing.assert_allclose(points[valid][:, :3], xyz[valid], atol=abs(scale) / 2)
+            np.testing.assert_allclose(points[..., 3][valid], residuals[valid], atol=abs(scale) / 2)
+            # Invalid points are flagged with a residual (and camera count) of -1
+            np.testing.assert_array_equal(points[:, 1, 3:], -1)
+            # Cameras are read back as the number of bits set in the mask
+            counts = [bin(m).count('1') for m in camera_mask[valid]]
+            np.testing.assert_array_equal(points[..., 4][valid], counts)
+
+    def test_soa_matches_tuples(self):
+        for scale in (0.1, -1.):
+            frames = gen_frames(scale=scale)
+            points = np.array([p for p, _ in frames])
+            camera_mask = (1 << points[..., 4].clip(0, 7).astype(np.uint16)) - 1
+            data = self.write_soa(scale, points[..., :3], points[..., 3], camera_mask)
+            assert data == write_frames(frames, scale=scale)
+
+    def write_file(self, frames):
+        w = c3d.Writer(point_rate=100., point_scale=-1.)
+        w.add_frames(frames)
+        with tempfile.TemporaryFile() as h:
+            w.write(h, ['M%d' % i for i in range(6)])
+            h.seek(0)
+            return h.read()
+
+    @unittest.skipUnless(hasattr(os, 'writev'), 'requires os.writev')
+    def test_write_file(self):
+        frames = gen_frames(nframes=2500)
+        assert self.write_file(frames) == write_frames(frames)
+        # Batches written in several groups
+        with mock.patch('c3d._IOV_MAX', 2):
+            assert self.write_file(frames) == write_frames(frames)
+
+        # Compressed files are written through the file object
+        w = c3d.Writer(point_rate=100., point_scale=-1.)
+        w.add_frames(frames)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'frames.c3d.gz')
+            with gzip.open(path, 'wb') as h:
+                w.write(h, ['M%d' % i for i in range(6)])
+            with gzip.open(path, 'rb') as h:
+                assert h.read() == write_frames(frames)
+
+    @unittest.skipUnless(hasattr(os, 'writev'), 'requires os.writev')
+    def test_write_file_partial(self):
+        def short_writev(fd, buffers):
+            # Write at most 100 bytes per call
+            return os.write(fd, bytes(buffers[0])[:100])
+
+        frames = gen_frames(nframes=50)
+        with mock.patch('os.writev', side_effect=short_writev) as writev:
+            data = self.write_file(frames)
+        assert writev.call_count > 1
+        assert data == write_frames(frames)
+
+
+class ReadFramesTest(unittest.TestCase):
+    def setUp(self):
+        self.data = write_frames(gen_frames())
+
+    def read(self, **kwargs):
+        return list(c3d.Reader(io.BytesIO(self.data)).read_frames(**kwargs))
+
+    def test_copy(self):
+        it = c3d.Reader(io.BytesIO(self.data)).read_frames()
+        _, points, analog = next(it)
+        expected = points.copy()
+        for _, p, a in it:
+            assert not np.shares_memory(points, p)
+        np.testing.assert_array_equal(points, expected)
+
+    def test_no_copy(self):
+        frames = self.read(copy=False)
+        base = frames[0][1].base
+        for i, (_, points, analog) in enumerate(frames):
+            # Views into a single block of decoded frames
+            assert np.shares_memory(points, base)
+            if i:
+                assert not np.shares_memory(points, frames[i - 1][1])
+        np.testing.assert_array_equal(frames[-1][1], self.read()[-1][1])
+
+    def test_out_buffers(self):
+        expected = self.read()
+        out_points = np.empty_like(expected[0][1])
+        out_analog = np.empty_like(expected[0][2])
+        it = c3d.Reader(io.BytesIO(self.data)).read_frames(out_points=out_points, out_analog=out_analog)
+        for (_, points, analog), (_, p, a) in zip(it, expected):
+            assert points is out_points
+            assert analog is out_analog
+            np.testing.assert_array_equal(out_points, p)
+            np.testing.assert_array_equal(out_analog, a)
+
+    def test_files(self):
+        expected = self.read()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'frames.c3d')
+            with open(path, 'wb') as h:
+                h.write(self.data)
+            with gzip.open(path + '.gz', 'wb') as h:
+                h.write(self.data)
+            # Memory-mapped file and compressed file read as a stream
+            for handle in (open(path, 'rb'), gzip.open(path + '.gz', 'rb')):
+                with handle:
+                    frames = list(c3d.Reader(handle).read_frames())
+                assert len(frames) == len(expected)
+                for (_, points, _), (_, p, _) in zip(frames, expected):
+                    np.testing.assert_array_equal(points, p)
+
+    def test_truncated(self):
+        data = write_frames(gen_frames(nframes=2500))
+        start = (c3d.Reader(io.BytesIO(data)).header.data_block - 1) * 512
+        # Cut the file in the second batch of frames, within a frame
+        data = data[:start + 1500 * 6 * 16 + 50]
+        r = c3d.Reader(io.BytesIO(data))
+        with self.assertWarnsRegex(UserWarning, 'end of file'):
+            frames = list(r.read_frames(copy=False))
+        assert len(frames) == 1500
+
+
 if __name__ == '__main__':
     unittest.main()
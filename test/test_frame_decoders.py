@@ -0,0 +1,61 @@
+''' Tests comparing the compiled (numba) frame decoders with the NumPy decoders.
+'''
+import c3d
+import unittest
+import numpy as np
+
+
+def gen_raw_points(rng, dtype, shape=(40, 7)):
+    ''' Generate raw point words, including invalid points and camera bits.
+    '''
+    raw = np.empty(shape + (4,), dtype=dtype)
+    raw[..., :3] = rng.integers(-30000, 30000, shape + (3,))
+    # Residual byte and camera bits 8 to 14, bit 15 is set for some words
+    word = rng.integers(0, 0x8000, shape) | (rng.random(shape) < 0.1) * 0x8000
+    if np.dtype(dtype).kind == 'f':
+        word[rng.random(shape) < 0.2] = -1
+    else:
+        word = word.astype(np.uint16).view(np.int16)
+    raw[..., 3] = word
+    return raw
+
+
+@unittest.skipIf(c3d._decode_points_jit is None, 'requires numba')
+class FrameDecoderTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_points(self):
+        for dtype in ('<i2', '>i2', '<f4', '>f4'):
+            is_float = dtype[1] == 'f'
+            for scale in (1., 0.25):
+                raw = gen_raw_points(self.rng, dtype)
+                expected = np.zeros(raw.shape[:2] + (5,), np.float32)
+                c3d.Reader._decode_points(raw, scale, is_float, expected)
+                points = np.zeros_like(expected)
+                c3d._decode_points_jit(c3d._native(raw), scale, is_float, points)
+                np.testing.assert_allclose(points, expected, err_msg=dtype)
+
+    def test_frames(self):
+        channels, samples = 3, 4
+        gain = self.rng.uniform(0.1, 2, (channels, 1)).astype(np.float32)
+        bias = self.rng.uniform(-10, 10, (channels, 1)).astype(np.float32)
+        for dtype in ('<i2', '>i2', '<f4', '>f4'):
+            is_float = dtype[1] == 'f'
+            raw_points = gen_raw_points(self.rng, dtype)
+            raw_analog = self.rng.integers(-30000, 30000, (len(raw_points), samples, channels)).astype(dtype)
+
+            points = np.zeros(raw_points.shape[:2] + (5,), np.float32)
+            analog = np.zeros((len(raw_points), channels, samples), np.float32)
+            expected_points = np.zeros_like(points)
+            expected_analog = np.zeros_like(analog)
+            c3d.Reader._decode_points(raw_points, 0.5, is_float, expected_points)
+            c3d.Reader._decode_analog(raw_analog, gain, bias, expected_analog)
+            c3d._decode_frames_jit(c3d._native(raw_points), c3d._native(raw_analog), 0.5, is_float,
+                                   gain[:, 0], bias[:, 0], points, analog)
+            np.testing.assert_allclose(points, expected_points, err_msg=dtype)
+            np.testing.assert_allclose(analog, expected_analog, rtol=1e-5, atol=1e-3, err_msg=dtype)
+
+
+if __name__ == '__main__':
+    unittest.main()
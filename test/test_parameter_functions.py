@@ -1,4 +1,6 @@
 import c3d
+import copy
+import pickle
 import struct
 import unittest
 import numpy as np
@@ -332,6 +334,32 @@ class ParameterArrayTest(unittest.TestCase):
                 assert self.dtypes.decode_string(arr[i[::-1]]) == arr_out[i],\
                     "Mismatch in 'string_array' converted value at index %s" % str(i)
 
+    def test_j_string_array_reset_on_update(self):
+        '''    Verify decoded string arrays follow updates to the parameter bytes
+        '''
+        arr, shape = genByteWordArr(b'KNEE', [3])
+        P = c3d.Param('STRING_TEST', self.dtypes, bytes_per_element=-1, dimensions=shape, bytes=arr.T.tobytes())
+        assert list(P.string_array) == ['KNEE'] * 3, 'Mismatch in initial string_array'
+
+        arr, shape = genByteWordArr(b'HIP', [2])
+        P.dimensions = shape
+        P.bytes = arr.T.tobytes()
+        assert list(P.string_array) == ['HIP'] * 2, "'string_array' was not updated with the parameter bytes"
+        assert list(P.bytes_array) == [b'HIP'] * 2, "'bytes_array' was not updated with the parameter bytes"
+
+    def test_k_copy_memoryview_param(self):
+        '''    Verify parameters holding a view into the parameter section can be copied and pickled
+        '''
+        arr, shape = genByteWordArr(b'KNEE', [3])
+        section = arr.T.tobytes()
+        P = c3d.Param('STRING_TEST', self.dtypes, bytes_per_element=-1, dimensions=shape,
+                      bytes=memoryview(section))
+        assert list(P.string_array) == ['KNEE'] * 3
+        for Q in (copy.deepcopy(P), pickle.loads(pickle.dumps(P))):
+            assert Q.bytes == section, 'Mismatch in copied parameter bytes'
+            assert Q.dimensions == shape
+            assert list(Q.string_array) == ['KNEE'] * 3, "Mismatch in copied 'string_array'"
+
 
 if __name__ == '__main__':
     unittest.main()